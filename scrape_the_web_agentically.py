@@ -1,14 +1,64 @@
 """Agentic web scraping example using Firecrawl and LangGraph."""
 
+import asyncio
+import functools
+import hashlib
 import logging
+import re
 from operator import or_
-from typing import Any, Dict, List, Optional, TypedDict
+from typing import Any, Dict, List, Optional, Set, TypedDict
+from urllib.parse import urlsplit, urlunsplit
 
+import diskcache
 from firecrawl import FirecrawlApp
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
 from langgraph.graph import END, START, StateGraph, Graph
+from langgraph.types import Command, Send
 from pydantic_settings import BaseSettings
 from typing_extensions import Annotated
 
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+BATCH_SIZE = 16
+MAX_CONCURRENCY = 8
+PREVIEW_BEFORE_CHARS = 256
+PREVIEW_TOTAL_CHARS = 2048
+SCRAPE_TIMEOUT_MS = 10000
+CHECKPOINT_DB = "scrape_state.db"
+CONTENT_CACHE_DIR = "./scrape_cache"
+CONTENT_CACHE_TTL_S = 86400
+SITEMAP_CACHE_DIR = "./sitemap_cache"
+SITEMAP_CACHE_TTL_S = 3600
+
+SCRAPE_SEMAPHORE = asyncio.Semaphore(MAX_CONCURRENCY)
+
+_PROGRESS = {"completed": 0, "total": 0, "bucket": -1}
+
+def reset_progress(total: int) -> None:
+    """Reset the shared progress counters for a new scraping run."""
+    _PROGRESS["completed"] = 0
+    _PROGRESS["total"] = total
+    _PROGRESS["bucket"] = -1
+
+def report_progress(count: int) -> None:
+    """Record completed URLs, logging only when the integer percent bucket changes."""
+    _PROGRESS["completed"] += count
+    total = _PROGRESS["total"]
+    if not total:
+        return
+    bucket = _PROGRESS["completed"] * 100 // total
+    if bucket != _PROGRESS["bucket"]:
+        _PROGRESS["bucket"] = bucket
+        logging.info(f"Progress: {_PROGRESS['completed']}/{total} URLs ({bucket}%)")
+
 class Settings(BaseSettings):
     firecrawl_url: str = "http://localhost:3002"
 
@@ -38,6 +88,99 @@ def setup_logging(level: int = logging.INFO) -> None:
     handler.setFormatter(formatter)
     logger.addHandler(handler)
 
+@functools.lru_cache(maxsize=8)
+def get_app(api_url: str) -> FirecrawlApp:
+    """Return a cached FirecrawlApp so all calls share one connection pool."""
+    return FirecrawlApp(api_url=api_url)
+
+@functools.lru_cache(maxsize=8)
+def get_cache(directory: str) -> diskcache.Cache:
+    """Return a cached diskcache handle for the given directory."""
+    return diskcache.Cache(directory)
+
+def split_keywords(keyword: str) -> List[str]:
+    """Split a comma-separated keyword string into individual search terms."""
+    return [term.strip() for term in keyword.split(',') if term.strip()]
+
+@functools.lru_cache(maxsize=32)
+def get_keyword_pattern(keyword: str) -> 're.Pattern':
+    """Compile the keyword terms into one case-insensitive alternation pattern."""
+    terms = split_keywords(keyword) or [keyword]
+    return re.compile('|'.join(re.escape(term) for term in terms), re.IGNORECASE)
+
+@functools.lru_cache(maxsize=32)
+def get_keyword_matcher(keyword: str):
+    """Build a cached matcher that checks text for any of the keyword terms.
+
+    Uses a hyperscan database when available so all terms are matched in a
+    single pass over the text; otherwise falls back to a precompiled
+    case-insensitive regex, which scans the original buffer in one C-level
+    pass without allocating a casefolded copy of the page.
+    """
+    keywords = split_keywords(keyword)
+
+    if hyperscan is not None and keywords:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[term.encode('utf-8') for term in keywords],
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_LITERAL] * len(keywords),
+        )
+
+        def matcher(text: str) -> bool:
+            found = False
+
+            def on_match(*_args: Any) -> None:
+                nonlocal found
+                found = True
+
+            db.scan(text.encode('utf-8'), match_event_handler=on_match)
+            return found
+
+        return matcher
+
+    pattern = get_keyword_pattern(keyword)
+
+    def matcher(text: str) -> bool:
+        return pattern.search(text) is not None
+
+    return matcher
+
+def find_first_match(keyword: str, text: str) -> tuple:
+    """Return (offset, length) of the earliest keyword term in text, or (-1, 0)."""
+    match = get_keyword_pattern(keyword).search(text)
+    if match is None:
+        return (-1, 0)
+    return (match.start(), match.end() - match.start())
+
+def fetch_sitemap_links(api_url: str, url: str, refresh: bool = False) -> List[str]:
+    """Fetch sitemap links via Firecrawl, serving from the disk cache within its TTL."""
+    cache = get_cache(SITEMAP_CACHE_DIR)
+    if refresh:
+        cache.delete(url)
+
+    links = cache.get(url)
+    if links is not None:
+        logging.info(f"Using cached sitemap for {url}")
+        return links
+
+    map_result = get_app(api_url).map_url(url)
+    links = list(map_result.links) if hasattr(map_result, 'links') and map_result.links else []
+    if links:
+        cache.set(url, links, expire=SITEMAP_CACHE_TTL_S)
+    return links
+
+def canonicalize_url(url: str) -> str:
+    """Normalize a URL so duplicates from the sitemap collapse to one entry."""
+    parts = urlsplit(url)
+    query = '&'.join(sorted(parts.query.split('&'))) if parts.query else ''
+    return urlunsplit((parts.scheme, parts.netloc, parts.path.rstrip('/') or '/', query, ''))
+
+def score_url_relevance(url: str, keyword_tokens: Set[str]) -> float:
+    """Score a URL by keyword-token overlap in its path, minus a depth penalty."""
+    path = urlsplit(url).path.lower()
+    path_tokens = set(re.findall(r"\w+", path))
+    return len(keyword_tokens & path_tokens) - 0.1 * path.count('/')
+
 def first_non_null(a: Any, b: Any) -> Any:
     """Return the first non-null value between two values."""
     return a if a is not None else b
@@ -50,12 +193,15 @@ class InputState(TypedDict):
 class OverallState(TypedDict):
     """Overall state schema for the LangGraph agent."""
     urls: List[str]
-    current_url_index: int
     total_urls: int
     urls_to_scrape: List[str]
+    content_key: Annotated[Optional[str], first_non_null]
+    match_offset: Annotated[Optional[int], first_non_null]
+    match_len: Annotated[Optional[int], first_non_null]
     extracted_info: Annotated[Optional[str], first_non_null]
     extracted_from_url: Annotated[Optional[str], first_non_null]
     is_information_found: Annotated[Optional[bool], or_]
+    visited_urls: Annotated[Set[str], or_]
     keyword: str
 
 def initialize_state(state: Dict[str, Any], config: Dict[str, Any]) -> OverallState:
@@ -68,13 +214,16 @@ def initialize_state(state: Dict[str, Any], config: Dict[str, Any]) -> OverallSt
     
     return {
         "urls": [url],
-        "current_url_index": 0,
         "total_urls": 0,
         "urls_to_scrape": [],
         "keyword": keyword,
+        "content_key": None,
+        "match_offset": None,
+        "match_len": None,
         "extracted_info": None,
         "extracted_from_url": None,
-        "is_information_found": False
+        "is_information_found": False,
+        "visited_urls": set()
     }
 
 def get_sitemap(state: OverallState, config: Dict[str, Any]) -> OverallState:
@@ -82,7 +231,7 @@ def get_sitemap(state: OverallState, config: Dict[str, Any]) -> OverallState:
     logging.info("Executing node: get_sitemap")
 
     settings: Settings = config.get("settings", Settings())
-    app = FirecrawlApp(api_url=settings.firecrawl_url)
+    refresh_sitemap = config.get("configurable", {}).get("refresh_sitemap", False)
     logging.info(f"Using Firecrawl server at {settings.firecrawl_url}")
 
     initial_url = state["urls"][0]
@@ -98,9 +247,9 @@ def get_sitemap(state: OverallState, config: Dict[str, Any]) -> OverallState:
         sitemap = [initial_url]
         
         try:
-            map_result = app.map_url(initial_url)
-            if hasattr(map_result, 'links') and isinstance(map_result.links, list) and map_result.links:
-                sitemap = map_result.links
+            links = fetch_sitemap_links(settings.firecrawl_url, initial_url, refresh=refresh_sitemap)
+            if links:
+                sitemap = links
                 logging.info(f"Found {len(sitemap)} links in sitemap")
             else:
                 logging.info("No sitemap links found. Using only the initial URL.")
@@ -115,10 +264,21 @@ def get_sitemap(state: OverallState, config: Dict[str, Any]) -> OverallState:
         if len(valid_urls) < len(sitemap):
             logging.warning(f"Filtered out {len(sitemap) - len(valid_urls)} invalid URLs from sitemap.")
         
+        deduped_urls = list(dict.fromkeys(canonicalize_url(url) for url in valid_urls))
+        if len(deduped_urls) < len(valid_urls):
+            logging.info(f"Collapsed {len(valid_urls) - len(deduped_urls)} duplicate URLs from sitemap.")
+        valid_urls = deduped_urls
+
         if not valid_urls:
             logging.warning("No valid URLs found in sitemap. Using initial URL as fallback.")
             valid_urls = [initial_url]
-            
+
+        keyword = state.get("keyword", "")
+        if keyword:
+            keyword_tokens = set(re.findall(r"\w+", keyword.lower()))
+            valid_urls.sort(key=lambda u: score_url_relevance(u, keyword_tokens), reverse=True)
+            logging.info("Reordered sitemap URLs by keyword affinity.")
+
         state["urls"] = valid_urls
         state["total_urls"] = len(valid_urls)
         logging.info(f"Found {len(valid_urls)} URLs to process.")
@@ -132,132 +292,188 @@ def get_sitemap(state: OverallState, config: Dict[str, Any]) -> OverallState:
     return state
 
 
-def scrape_manager(state: OverallState) -> OverallState:
-    """Manage the batching of URLs for scraping."""
-    logging.info("Executing node: scrape_manager")
-
-    total_urls = state.get("total_urls", 0)
-    current_index = state.get("current_url_index", 0)
+def send_to_scraper(state: OverallState) -> Any:
+    """Fan the sitemap out into one parallel scraper branch per URL."""
     urls = state.get("urls", [])
+    keyword = state.get("keyword", "")
+    visited_urls = state.get("visited_urls") or set()
 
-    if not urls or current_index >= total_urls:
-        if not urls:
-            logging.warning("No URLs available for scraping.")
-        else:
-            logging.info("All URLs have been processed.")
-            
-        state["urls_to_scrape"] = []
-        return state
+    pending_urls = [url for url in urls if url not in visited_urls]
+    skipped = len(urls) - len(pending_urls)
+    if skipped:
+        logging.info(f"Skipping {skipped} already-visited URLs.")
 
-    url_to_scrape = urls[current_index]
-    state["current_url_index"] = current_index + 1
-    state["urls_to_scrape"] = [url_to_scrape]
+    if not pending_urls:
+        logging.info("No URLs left to scrape.")
+        return "evaluate"
 
-    progress_percentage = (current_index / total_urls) * 100 if total_urls > 0 else 0
-    logging.info(f"Processing URL {current_index + 1}/{total_urls}: {url_to_scrape} (Progress: {progress_percentage:.2f}%)")
+    logging.info(f"Dispatching {len(pending_urls)} URLs to parallel scraper branches.")
+    reset_progress(len(pending_urls))
 
-    return state
+    return [
+        Send("scraper", {"urls_to_scrape": pending_urls[start:start + BATCH_SIZE], "keyword": keyword})
+        for start in range(0, len(pending_urls), BATCH_SIZE)
+    ]
 
 
-def send_to_scraper(state: OverallState) -> List[Dict[str, Any]]:
-    """Prepare individual URL scraping tasks."""
-    urls_to_scrape = state.get("urls_to_scrape", [])
-    keyword = state.get("keyword", "")
+def content_cache_key(url: str) -> str:
+    """Return the disk-cache key for a URL's page content."""
+    return hashlib.sha1(url.encode()).hexdigest()
 
-    if not urls_to_scrape:
-        return []
 
-    logging.info(f"Processing {len(urls_to_scrape)} URLs in scraper node.")
+def document_source_url(document: Any) -> Optional[str]:
+    """Pull the source URL out of a batch-scrape document's metadata."""
+    metadata = getattr(document, 'metadata', None)
+    if isinstance(metadata, dict):
+        return metadata.get('sourceURL') or metadata.get('source_url') or metadata.get('url')
+    if metadata is not None:
+        return getattr(metadata, 'source_url', None) or getattr(metadata, 'url', None)
+    return None
 
-    return [{"url": url, "keyword": keyword} for url in urls_to_scrape]
 
+def match_markdown(url: str, keyword: str, markdown: str) -> Optional[Dict[str, Any]]:
+    """Check markdown for the keyword and return the match info on a hit.
 
-def scraper(state: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any]:
-    """Scrape a single URL for content relevant to the keyword."""
-    urls = state.get("urls_to_scrape", [])
-    if urls:
-        url = urls[0]
-        keyword = state.get("keyword", "")
-        logging.info(f"Using URL from urls_to_scrape: {url}")
-    else:
-        logging.error("Empty urls_to_scrape list")
-        return {
-            "extracted_info": None,
-            "extracted_from_url": None,
-            "is_information_found": False
-        }
+    Only the content-cache key and match position travel through state;
+    the full page lives in the disk content cache.
+    """
+    if not get_keyword_matcher(keyword)(markdown):
+        return None
 
-    if not url:
-        logging.error("No URL found in state")
-        return {
-            "extracted_info": None,
-            "extracted_from_url": None,
-            "is_information_found": False
-        }
-
-    settings: Settings = config.get("settings", Settings())
+    content_key = content_cache_key(url)
+    match_offset, match_len = find_first_match(keyword, markdown)
+    logging.info(f"Found keyword '{keyword}' at {url}")
 
-    app = FirecrawlApp(api_url=settings.firecrawl_url)
-    logging.info(f"Using Firecrawl server at {settings.firecrawl_url}")
-
-    extracted_info: Optional[str] = None
-    information_found: bool = False
-
-    try:
-        logging.info(f"Starting scrape for: {url}")
+    preview_start = max(0, match_offset - PREVIEW_BEFORE_CHARS)
+    preview = markdown[preview_start:preview_start + PREVIEW_TOTAL_CHARS]
 
-        scrape_result = app.scrape_url(url)
-        logging.info(f"Successfully scraped: {url}")
-
-        logging.info(f"Processing API response of type: {type(scrape_result)}")
+    return {
+        "content_key": content_key,
+        "match_offset": match_offset,
+        "match_len": match_len,
+        "extracted_info": preview,
+        "extracted_from_url": url,
+        "is_information_found": True,
+    }
 
-        extracted_metadata = ""
-        extracted_html = ""
-        extracted_markdown = ""
-        extracted_text = ""
 
-        if hasattr(scrape_result, 'metadata') and scrape_result.metadata:
-            extracted_html = str(scrape_result.metadata)
+async def scraper(state: Dict[str, Any], config: Dict[str, Any]) -> Any:
+    """Batch-scrape the branch's URLs in one Firecrawl call and search for the keyword.
 
-        if hasattr(scrape_result, 'html') and scrape_result.html:
-            extracted_html = str(scrape_result.html)
+    Routing is done entirely via Command: a hit jumps straight to END,
+    skipping the evaluate hop, while misses go to evaluate explicitly.
+    """
+    urls = [url for url in state.get("urls_to_scrape", []) if url]
+    if not urls:
+        logging.error("Empty urls_to_scrape list")
+        return Command(goto="evaluate", update={
+            "content_key": None,
+            "extracted_from_url": None,
+            "is_information_found": False
+        })
 
-        if hasattr(scrape_result, 'markdown') and scrape_result.markdown:
-            extracted_markdown = str(scrape_result.markdown)
+    keyword = state.get("keyword", "")
 
-        if hasattr(scrape_result, 'text') and scrape_result.text:
-            extracted_text = str(scrape_result.text)
+    settings: Settings = config.get("settings", Settings())
 
-        extracted_info = extracted_metadata + extracted_html + extracted_markdown + extracted_text
+    app = get_app(settings.firecrawl_url)
+    logging.info(f"Using Firecrawl server at {settings.firecrawl_url}")
 
-        if extracted_info and keyword.lower() in extracted_info.lower():
-            information_found = True
-            logging.info(f"Found keyword '{keyword}' in extracted content")
+    cache = get_cache(CONTENT_CACHE_DIR)
+    visited_urls: Set[str] = set()
 
-        if not extracted_info:
-            logging.warning(f"Failed to extract content from {url}")
+    try:
+        urls_to_fetch: List[str] = []
+        for url in urls:
+            cached_markdown = cache.get(content_cache_key(url))
+            if cached_markdown is None:
+                urls_to_fetch.append(url)
+                continue
+
+            if isinstance(cached_markdown, bytes):
+                cached_markdown = cached_markdown.decode('utf-8')
+
+            visited_urls.add(url)
+            match = match_markdown(url, keyword, cached_markdown)
+            if match:
+                match["visited_urls"] = set(visited_urls)
+                return Command(goto=END, update=match)
+
+        if len(urls_to_fetch) < len(urls):
+            logging.info(f"Served {len(urls) - len(urls_to_fetch)} URLs from the content cache.")
+
+        if not urls_to_fetch:
+            return Command(goto="evaluate", update={
+                "content_key": None,
+                "extracted_from_url": None,
+                "is_information_found": False,
+                "visited_urls": visited_urls,
+            })
+
+        logging.info(f"Batch scraping {len(urls_to_fetch)} URLs in one request")
+        async with SCRAPE_SEMAPHORE:
+            batch_result = await asyncio.to_thread(
+                app.batch_scrape_urls,
+                urls_to_fetch,
+                formats=["markdown"],
+                only_main_content=True,
+                timeout=SCRAPE_TIMEOUT_MS,
+            )
+
+        documents = getattr(batch_result, 'data', None) or []
+        requested_urls = set(urls_to_fetch)
+        returned_urls: Set[str] = set()
+        for document in documents:
+            url = document_source_url(document)
+            if url and url not in requested_urls:
+                url = canonicalize_url(url)
+            if not url or url not in requested_urls:
+                logging.warning(f"Skipping batch result with unrecognized source URL: {url}")
+                continue
+            returned_urls.add(url)
+            visited_urls.add(url)
+
+            markdown = getattr(document, 'markdown', None)
+            if not markdown:
+                logging.warning(f"Failed to extract content from {url}")
+                continue
+
+            cache.set(content_cache_key(url), markdown.encode('utf-8'), expire=CONTENT_CACHE_TTL_S)
+
+            match = match_markdown(url, keyword, markdown)
+            if match:
+                match["visited_urls"] = set(visited_urls)
+                return Command(goto=END, update=match)
+
+        missing = len(requested_urls - returned_urls)
+        if missing:
+            logging.warning(f"No batch result returned for {missing} of {len(urls_to_fetch)} URLs; they stay pending for retry.")
 
     except Exception as e:
-        logging.error(f"Error scraping {url}: {e}")
+        logging.error(f"Error batch scraping {len(urls)} URLs: {e}")
 
-    return {
-        "extracted_info": extracted_info,
-        "extracted_from_url": url,
-        "is_information_found": information_found,
-    }
+    finally:
+        report_progress(len(urls))
+
+    return Command(goto="evaluate", update={
+        "content_key": None,
+        "extracted_from_url": None,
+        "is_information_found": False,
+        "visited_urls": visited_urls,
+    })
 
 def evaluate(state: OverallState) -> Dict[str, Any]:
     """Evaluate if the required information has been found."""
     logging.info("Executing node: evaluate")
     keyword = state.get("keyword", "unknown keyword")
     extracted_from_url = state.get("extracted_from_url")
-    extracted_info = state.get("extracted_info")
 
     if state.get("is_information_found"):
         logging.info(f"Information found for keyword '{keyword}' from URL: {extracted_from_url}")
         return {
             "is_information_found": True,
-            "extracted_info": extracted_info,
+            "content_key": state.get("content_key"),
+            "extracted_info": state.get("extracted_info"),
             "extracted_from_url": extracted_from_url,
             "keyword": keyword
         }
@@ -265,27 +481,7 @@ def evaluate(state: OverallState) -> Dict[str, Any]:
         logging.info(f"Information not yet found for keyword '{keyword}'")
         return {"is_information_found": False}
 
-def should_continue_scraping(state: OverallState) -> str:
-    """Determine the next step after evaluation."""
-    logging.info("Executing node: should_continue_scraping (conditional edge)")
-
-    is_information_found = state.get("is_information_found", False)
-    current_index = state.get("current_url_index", 0)
-    total_urls = state.get("total_urls", 0)
-
-    if is_information_found:
-        batch_number = current_index // 1
-        logging.info(f"Information found in batch {batch_number}")
-        return "end_process"
-
-    if current_index >= total_urls:
-        logging.info(f"All {total_urls} URLs processed without finding information. Ending process.")
-        return "end_process"
-
-    logging.info(f"Information not found in URL {current_index}/{total_urls}. Continuing to next URL.")
-    return "continue_scraping"
-
-def create_graph(settings: Settings) -> Graph:
+def create_graph(settings: Settings, checkpointer: Optional[AsyncSqliteSaver] = None) -> Graph:
     """Create the LangGraph workflow for web scraping."""
     logging.info("Creating LangGraph workflow for web scraping")
 
@@ -293,34 +489,23 @@ def create_graph(settings: Settings) -> Graph:
 
     builder.add_node("initialize_state", initialize_state)
     builder.add_node("get_sitemap", get_sitemap)
-    builder.add_node("scrape_manager", scrape_manager)
     builder.add_node("scraper", scraper)
     builder.add_node("evaluate", evaluate)
 
     builder.add_edge(START, "initialize_state")
     builder.add_edge("initialize_state", "get_sitemap")
-    builder.add_edge("get_sitemap", "scrape_manager")
-    builder.add_edge("scrape_manager", "scraper")
-    builder.add_edge("scraper", "evaluate")
-
-    builder.add_conditional_edges(
-        "evaluate",
-        should_continue_scraping,
-        {
-            "continue_scraping": "scrape_manager",
-            "end_process": END
-        }
-    )
+    builder.add_conditional_edges("get_sitemap", send_to_scraper, ["scraper", "evaluate"])
+    builder.add_edge("evaluate", END)
 
     try:
-        graph = builder.compile()
+        graph = builder.compile(checkpointer=checkpointer)
         logging.info("Graph compiled successfully.")
         return graph
     except Exception as e:
         logging.error(f"Failed to compile graph: {e}")
         raise RuntimeError(f"Graph compilation failed: {e}") from e
 
-def main(url: str = "", keyword: str = "") -> None:
+async def main(url: str = "", keyword: str = "", refresh_sitemap: bool = False) -> None:
     """Run the web scraping agent with local Firecrawl."""
     setup_logging()
 
@@ -334,12 +519,15 @@ def main(url: str = "", keyword: str = "") -> None:
         logging.error("No target URL provided")
         return
 
-    graph = create_graph(settings)
+    thread_id = hashlib.sha1(f"{url}|{keyword}".encode()).hexdigest()
+    logging.info(f"Using checkpoint thread_id: {thread_id}")
 
     config = {
         "configurable": {
             "url": url,
-            "keyword": keyword
+            "keyword": keyword,
+            "refresh_sitemap": refresh_sitemap,
+            "thread_id": thread_id
         },
         "settings": settings,
         "recursion_limit": 2000
@@ -348,31 +536,9 @@ def main(url: str = "", keyword: str = "") -> None:
     logging.info("\nStarting processing...")
 
     try:
-        state = {}
-        processed_count = 0
-        max_batches = 100
-
-        for batch in range(max_batches):
-            state = graph.invoke(state, config=config)
-
-            if state.get("is_information_found", False):
-                logging.info(f"Information found in batch {batch + 1}")
-                break
-
-            current_index = state.get("current_url_index", 0)
-            total_urls = state.get("total_urls", 0)
-            processed_count = current_index
-
-            if current_index >= total_urls:
-                logging.info("All URLs processed")
-                break
-
-            progress = (current_index / total_urls) * 100 if total_urls > 0 else 0
-            logging.info(f"Progress: {current_index}/{total_urls} URLs ({progress:.2f}%)")
-
-            if batch > 10 and batch % 10 == 0:
-                logging.info(f"Processed {batch} batches without finding information. Continuing...")
-
+        async with AsyncSqliteSaver.from_conn_string(CHECKPOINT_DB) as checkpointer:
+            graph = create_graph(settings, checkpointer)
+            state = await graph.ainvoke({}, config=config)
     except Exception as e:
         logging.error(f"Error during graph execution: {e}")
         state = None
@@ -381,14 +547,13 @@ def main(url: str = "", keyword: str = "") -> None:
     if state:
         if state.get("is_information_found", False):
             found_url = state.get("extracted_from_url", "unknown")
-            extracted_info = state.get("extracted_info", "")
             logging.info(f"\n✅ Information for '{keyword}' found at {found_url}")
 
+            extracted_info = state.get("extracted_info")
             if extracted_info:
-                info_preview = extracted_info[:500] + "..." if len(extracted_info) > 500 else extracted_info
-                logging.info(f"\nExtracted information preview:\n{info_preview}")
+                logging.info(f"\nExtracted information preview:\n{extracted_info}")
         else:
-            processed = state.get("current_url_index", processed_count)
+            processed = len(state.get("visited_urls") or [])
             logging.info(f"\n❌ Information for '{keyword}' could not be found after checking {processed} URLs.")
     else:
         logging.warning("No state was returned from the graph execution.")
@@ -400,4 +565,6 @@ if __name__ == "__main__":
     if not target_url or not search_keyword:
         print("Please set the target_url and search_keyword variables.")
     else:
-        main(target_url, search_keyword)
+        if uvloop is not None:
+            uvloop.install()
+        asyncio.run(main(target_url, search_keyword))